@@ -1 +1,3 @@
 from .onepassword import OnePassword
+from .aio import AsyncOnePassword
+from .connect import ConnectClient
@@ -0,0 +1,265 @@
+import asyncio
+
+import onepassword.exceptions as opex
+
+from typing import Dict, List, Tuple
+
+from onepassword.onepassword import _loads, _JSON_ERRORS
+
+
+async def _run_cmd(cmd: List) -> bytes:
+    """
+    Runs an `op` command without blocking the event loop and returns its stdout.
+
+    Args:
+        cmd (list): the full command line, starting with "op"
+    Returns:
+        bytes: the command's stdout
+
+    Raises:
+        OnePasswordCLINotFound: If the 1password-CLI is not found due to a FileNotFoundError exception
+        OnePasswordRuntimeError: if the command exits with a non-zero code
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError:
+        raise opex.OnePasswordCLINotFound(
+            msg="Cannot find `op`, do you have 1password-cli installed?"
+        )
+
+    stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise opex.OnePasswordRuntimeError(
+            f"Encountered an error when calling subprocess, got: {stderr.decode(errors='replace')}"
+        )
+    return stdout
+
+
+async def list_vaults() -> Dict | List[Dict]:
+    """
+    Return a list of all vaults accessible to the 1password account
+
+    Returns:
+         Dict | List[Dict]: either a single dictionary for a vault, or list of dictionaries for multiple vaults
+    """
+
+    cmd = ["op", "vault", "list", "--format", "json"]
+    return _loads(await _run_cmd(cmd))
+
+
+class AsyncOnePassword:
+    """
+    Asyncio counterpart to `OnePassword`.
+
+    Each getter awaits its own `op` subprocess, so independent lookups can be
+    scheduled concurrently with `asyncio.gather` (see `get_items`) instead of
+    serialising one spawn after another. Concurrency is bounded by a semaphore
+    so bulk fetches do not thrash the CLI.
+    """
+
+    def __init__(self, vault: str = "Private", concurrency: int = 8) -> None:
+        """
+        Initialise the class with a vault, that by default is set to "Private".
+
+        Args:
+             vault (str): string representation of which vault the class has to be initialised with.
+                          Default is "Private"
+             concurrency (int): maximum number of `op` subprocesses allowed in
+                          flight at once. Default is 8
+        """
+        self.vault = vault
+        self._sem = asyncio.Semaphore(concurrency)
+
+    async def get_item(self, item: str, fields: List = None) -> Dict | List[Dict]:
+        """
+        Returns either a string or dictionary response from 1Password
+
+        Args:
+            item (str): Can be either the name of the resource or its ID
+            fields (list): (optional) This is to narrow down any field values for your return criteria.
+                            e.g. receiving a list containing: ['username', 'password']
+        Returns:
+            Dict | List[Dict]: either a single item as a dictionary or multiple items as a list of dictionaries
+
+        Raises:
+            OnePasswordJSONError: if the response cannot be JSON loaded due to a JSONDecodeError exception
+        """
+
+        cmd = [
+            "op",
+            "item",
+            "get",
+            item,
+            "--format",
+            "json",
+            "--vault",
+            f"{self.vault}",
+        ]
+
+        if fields:
+            cmd += ["--fields", ",".join(f"label={field}" for field in fields)]
+
+        async with self._sem:
+            stdout = await _run_cmd(cmd)
+        try:
+            return _loads(stdout)
+        except _JSON_ERRORS as e:
+            raise opex.OnePasswordJSONError(
+                f"Cannot JSON load response from 1Password. Got {e}"
+            )
+
+    async def get_items(self, items: List[str]) -> List[Dict | List[Dict]]:
+        """
+        Fetch several items concurrently with a single `asyncio.gather`,
+        bounded by the instance's semaphore.
+
+        Args:
+            items (list): names or UUIDs of items in Vault
+        Returns:
+            List: the `get_item` response for each requested item, in order
+        """
+        return list(await asyncio.gather(*(self.get_item(item) for item in items)))
+
+    async def get_value(self, item: str, field: str) -> str:
+        """
+        Retrieve an artefact from 1password and attempt to parse the field's value from it
+
+        Args:
+            item (str): name or UUID of item in Vault
+            field (str): string of field name to use as label
+        Returns:
+            str: a string representation of item's `field` value
+
+        Raises:
+            OnePasswordValueNotFound: if `value` has not been found in the dictionary
+        """
+        try:
+            return (await self.get_item(item, fields=[field]))["value"]
+        except KeyError as e:
+            raise opex.OnePasswordValueNotFound(f"Value not found. Got error: {e}")
+
+    async def get_values(self, item: str, fields: List) -> Dict:
+        """
+        Retrieve several field values from an item with a single `op` call,
+        rather than one call per field.
+
+        Args:
+            item (str): name or UUID of item in Vault
+            fields (list): field labels to look up, e.g. ['username', 'password']
+        Returns:
+            Dict: a mapping of field label to value for the requested fields
+
+        Raises:
+            OnePasswordValueNotFound: if a returned field is missing its label or value
+        """
+        r = await self.get_item(item, fields=fields)
+        if isinstance(r, dict):
+            r = [r]
+        wanted = set(fields)
+        try:
+            return {f["label"]: f["value"] for f in r if f["label"] in wanted}
+        except KeyError as e:
+            raise opex.OnePasswordValueNotFound(f"Value not found. Got error: {e}")
+
+    async def get_credentials(self, item: str) -> Tuple[str, str]:
+        """
+        Wrapper around `get_values` to get an item's username and password
+        together, spawning `op` once instead of twice.
+
+        Args:
+            item (str): name or UUID of item in Vault
+        Returns:
+            Tuple[str, str]: the item's username and password
+
+        Raises:
+            OnePasswordValueNotFound: if the item has no username or password field
+        """
+        values = await self.get_values(item, ["username", "password"])
+        try:
+            return values["username"], values["password"]
+        except KeyError as e:
+            raise opex.OnePasswordValueNotFound(f"Value not found. Got error: {e}")
+
+    async def get_username(self, item: str) -> str:
+        """
+        Wrapper around `get_value` to get a username value from an item
+
+        Args:
+            item (str): name or UUID of item in Vault
+        Returns:
+             str: a string representation of username
+        """
+
+        return await self.get_value(item, "username")
+
+    async def get_password(self, item: str) -> str:
+        """
+        Wrapper around `get_value` to get a password value from an item
+
+        Args:
+            item (str): name or UUID of item in Vault
+        Returns:
+             str: string representation of password
+        """
+
+        return await self.get_value(item, "password")
+
+    async def get_uuid(self, item: str) -> str:
+        """
+        Retrieve the UUID of an item
+
+        Args:
+            item (str): name of the item
+        Returns:
+            str: a string representation of an item's UUID
+
+        Raises:
+            OnePasswordValueNotFound: if `id` has not been found in the dictionary
+        """
+        try:
+            return (await self.get_item(item))["id"]
+        except KeyError as e:
+            raise opex.OnePasswordValueNotFound(f"Value not found. Got error: {e}")
+
+    async def get_document(self, item: str) -> bytes:
+        """
+        Retrieve's a document from 1Password in bytes format for later use
+
+        Args:
+            item (str): name or UUID of item in Vault
+        Returns:
+             bytes: a document in bytes format
+        """
+        cmd = ["op", "document", "get", item, "--vault", self.vault]
+
+        async with self._sem:
+            return await _run_cmd(cmd)
+
+    async def list_items(
+        self, categories: List = None, tags: List = None
+    ) -> Dict | List[Dict]:
+        """
+        List all available items within the instantiated vault.
+        Entries can be filtered with `categories` and `tags`. By default, these are None.
+
+        Args:
+            categories (list): (optional) A list of categories to filter the list with
+            tags (list): (optional) A list of tags to filter the list with
+        Returns:
+            Dict | List[Dict]: either a single item as a dictionary or multiple items as a list of dictionaries
+        """
+
+        cmd = ["op", "items", "list", "--vault", self.vault, "--format", "json"]
+
+        if categories:
+            cmd += ["--categories", ",".join(categories)]
+
+        if tags:
+            cmd += ["--tags", ",".join(tags)]
+
+        async with self._sem:
+            return _loads(await _run_cmd(cmd))
@@ -0,0 +1,71 @@
+import os
+import threading
+import time
+
+from typing import Any, Callable
+
+
+def cache_ttl() -> float | None:
+    """
+    Reads the opt-in cache TTL from the OP_PY_CACHE_TTL environment variable.
+
+    Caching secrets process-wide can surprise security-sensitive users, so it
+    is disabled unless explicitly requested.
+
+    Returns:
+        float | None: the TTL in seconds, or None when caching is disabled
+    """
+    raw = os.environ.get("OP_PY_CACHE_TTL")
+    if not raw:
+        return None
+    try:
+        ttl = float(raw)
+    except ValueError:
+        return None
+    return ttl if ttl > 0 else None
+
+
+class ItemCache:
+    """
+    Process-wide TTL-bounded cache for 1Password responses, shared across all
+    `OnePassword` instances so repeated fetches of the same secret cost a dict
+    lookup instead of an `op` invocation. Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key: Any, fetcher: Callable, ttl: float = 60) -> Any:
+        """
+        Returns the cached value for `key` if it has not expired, otherwise
+        calls `fetcher` and caches its result for `ttl` seconds.
+
+        Args:
+            key: a hashable cache key
+            fetcher: zero-argument callable producing the value on a miss
+            ttl (float): how long the fetched value stays fresh, in seconds.
+                         Default is 60
+        Returns:
+            the cached or freshly fetched value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                return entry[0]
+
+        # Fetch outside the lock so a slow `op` call does not serialise
+        # unrelated lookups
+        value = fetcher()
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# The shared cache consulted by OnePassword.get_item when OP_PY_CACHE_TTL is set
+item_cache = ItemCache()
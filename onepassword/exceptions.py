@@ -39,3 +39,12 @@ class OnePasswordRuntimeError(OnePasswordException):
 
     def __init__(self, msg) -> None:
         self.msg = msg
+
+
+class OnePasswordConnectError(OnePasswordException):
+    """
+    A generic exception for anything to do with talking to a 1Password Connect server
+    """
+
+    def __init__(self, msg) -> None:
+        self.msg = msg
@@ -1,17 +1,39 @@
+import concurrent.futures
+import functools
+import os
 import subprocess
 import json
 
+import onepassword.cache as opcache
 import onepassword.exceptions as opex
 
 from packaging.version import Version
-from typing import Dict, List
+from typing import BinaryIO, Dict, Iterator, List, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# orjson decodes straight from the bytes `op` writes to stdout and is roughly
+# 5x faster than the stdlib parser; fall back to json when it is not installed.
+_loads = orjson.loads if orjson is not None else json.loads
+_JSON_ERRORS = (
+    (json.JSONDecodeError, orjson.JSONDecodeError)
+    if orjson is not None
+    else (json.JSONDecodeError,)
+)
+
+
+@functools.lru_cache(maxsize=1)
 def get_op_cli_version() -> Version:
     """
     Retrieves the 1password-cli (op) version and returns the string version
     as a Version object.
 
+    The result is memoised: the installed CLI version cannot change within a
+    process, so `op --version` is only ever spawned once.
+
     Returns:
         Version: a Version object with the current 1password-cli version information
 
@@ -28,12 +50,96 @@ def get_op_cli_version() -> Version:
 
 
 def _run_cmd(cmd: List) -> subprocess.CompletedProcess | opex.OnePasswordRuntimeError:
-    r = subprocess.run(cmd, capture_output=True)
-    if r.returncode != 0:
-        raise opex.OnePasswordRuntimeError(
-            f"Encountered an error when calling subprocess, got: {r.stderr}"
+    # Popen with direct pipe reads instead of subprocess.run, whose
+    # capture_output path spins up a drain thread per captured pipe.
+    # close_fds=False lets CPython use posix_spawn rather than fork+exec.
+    # `op` writes bounded output, so reading stdout then stderr sequentially
+    # cannot deadlock.
+    try:
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False
+        )
+    except FileNotFoundError:
+        raise opex.OnePasswordCLINotFound(
+            msg="Cannot find `op`, do you have 1password-cli installed?"
         )
-    return r
+    # The context manager closes both pipes and reaps the child on every
+    # path, so no ResourceWarning leaks out of the happy or error case
+    with proc:
+        stdout = proc.stdout.read()
+        returncode = proc.wait()
+        if returncode != 0:
+            # stderr is only read (and decoded) on failure; the happy path
+            # skips the extra pipe read and bytes allocation entirely
+            stderr = proc.stderr.read().decode(errors="replace")
+            raise opex.OnePasswordRuntimeError(
+                f"Encountered an error when calling subprocess, got: {stderr}"
+            )
+    return subprocess.CompletedProcess(cmd, returncode, stdout, b"")
+
+
+class _OpSession:
+    """
+    Dispatch point for `op` commands. Current `op` releases expose no
+    interactive/REPL mode that would let a single long-lived child amortise
+    the CLI's startup cost (session decrypt, config load), so every command
+    runs as a one-shot subprocess; the seam keeps call sites unchanged should
+    the CLI ever grow one.
+    """
+
+    def run(self, cmd: List) -> subprocess.CompletedProcess:
+        """
+        Executes an `op` command as a one-shot subprocess.
+
+        Args:
+            cmd (list): the full command line, starting with "op"
+        Returns:
+            subprocess.CompletedProcess: the completed command with its stdout
+
+        Raises:
+            OnePasswordCLINotFound: If the 1password-CLI is not found due to a FileNotFoundError exception
+            OnePasswordRuntimeError: if the command exits with a non-zero code
+        """
+        return _run_cmd(cmd)
+
+
+# Invariant command fragments, built once instead of per call
+_VAULT_LIST = ("op", "vault", "list", "--format", "json")
+
+_DECODER = json.JSONDecoder()
+
+
+def _iter_json_array(buf: str | bytes) -> Iterator[Dict]:
+    """
+    Incrementally decodes a JSON array one element at a time using
+    `JSONDecoder.raw_decode`, so each entry is only materialised when the
+    caller consumes it rather than building the whole list up front.
+
+    Args:
+        buf (str | bytes): a JSON document, typically an array
+    Yields:
+        Dict: each element of the array; a non-array document is yielded whole
+    """
+    if isinstance(buf, bytes):
+        buf = buf.decode()
+
+    i = 0
+    end = len(buf)
+    while i < end and buf[i] in " \t\r\n":
+        i += 1
+
+    if i >= end or buf[i] != "[":
+        yield _loads(buf)
+        return
+
+    i += 1
+    while i < end:
+        while i < end and buf[i] in " \t\r\n,":
+            i += 1
+        if i >= end or buf[i] == "]":
+            return
+        obj, i = _DECODER.raw_decode(buf, i)
+        yield obj
 
 
 def list_vaults() -> Dict | List[Dict]:
@@ -44,8 +150,7 @@ def list_vaults() -> Dict | List[Dict]:
          Dict | List[Dict]: either a single dictionary for a vault, or list of dictionaries for multiple vaults
     """
 
-    cmd = ["op", "vault", "list", "--format", "json"]
-    return json.loads(_run_cmd(cmd).stdout)
+    return _loads(_run_cmd(list(_VAULT_LIST)).stdout)
 
 
 class OnePassword:
@@ -55,24 +160,109 @@ class OnePassword:
     https://developer.1password.com/docs/cli/get-started/
     """
 
+    # Invariant command prefixes, shared across instances and built once at
+    # class definition rather than on every call
+    _ITEM_GET = ("op", "item", "get")
+    _DOC_GET = ("op", "document", "get")
+    _ITEMS_LIST = ("op", "items", "list")
+    _FMT_JSON = ("--format", "json")
+
     def __init__(self, vault: str = "Private") -> None:
         """
         Initialise the class with a vault, that by default is set to "Private".
 
-        The class also grabs the 1Password CLI version and this is used as a catch to ensure that the CLI
-        is installed before initialisation.
+        The 1Password CLI version is no longer probed here; `op_cli_version`
+        fetches it lazily on first access, so constructing instances spawns no
+        subprocess at all.
 
         Args:
              vault (str): string representation of which vault the class has to be initialised with.
                           Default is "Private"
         """
-        self.op_cli_version = get_op_cli_version()
+        self._cli_version = None
         self.vault = vault
+        self._vault_uuid = None
+        self._vault_cmd_args = None
+        self._session = _OpSession()
+        self._get_item_cached = functools.lru_cache(maxsize=256)(self._get_item)
+
+    def __getstate__(self) -> Dict:
+        """
+        Supports pickling so instances can be handed to multiprocessing
+        workers, e.g. via a persistent `ProcessPoolExecutor`. The live `op`
+        session and the cache wrapper are process-local and excluded; each
+        worker rebuilds them on unpickle.
+        """
+        state = self.__dict__.copy()
+        del state["_session"]
+        del state["_get_item_cached"]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._session = _OpSession()
+        self._get_item_cached = functools.lru_cache(maxsize=256)(self._get_item)
+
+    @property
+    def op_cli_version(self) -> Version:
+        """
+        The installed 1password-cli version, resolved on first access and
+        reused for the lifetime of the process.
+
+        Returns:
+            Version: a Version object with the current 1password-cli version information
+
+        Raises:
+            OnePasswordCLINotFound: If the 1password-CLI is not found due to a FileNotFoundError exception
+        """
+        if self._cli_version is None:
+            self._cli_version = get_op_cli_version()
+        return self._cli_version
+
+    def _vault_id(self) -> str:
+        """
+        Resolves the configured vault name to its UUID once and reuses it for
+        every subsequent command, sparing `op` a server-side name lookup on
+        each call. Falls back to the raw string when resolution fails, e.g.
+        when the vault was already given by ID.
+
+        Returns:
+            str: the vault's UUID, or the configured vault string as given
+        """
+        if self._vault_uuid is None:
+            try:
+                vaults = list_vaults()
+            except opex.OnePasswordException:
+                vaults = []
+            if isinstance(vaults, dict):
+                vaults = [vaults]
+            self._vault_uuid = next(
+                (v["id"] for v in vaults if v.get("name") == self.vault),
+                self.vault,
+            )
+        return self._vault_uuid
+
+    def _vault_args(self) -> Tuple:
+        """
+        The ("--vault", <id>) argv fragment specialised on the resolved vault,
+        built once per instance and spliced into every command.
+
+        Returns:
+            Tuple: the pre-bound vault arguments
+        """
+        if self._vault_cmd_args is None:
+            self._vault_cmd_args = ("--vault", self._vault_id())
+        return self._vault_cmd_args
 
     def get_item(self, item: str, fields: List = None) -> Dict | List[Dict]:
         """
         Returns either a string or dictionary response from 1Password
 
+        Results are cached per instance, so repeated lookups of the same item
+        and fields only invoke `op` once. Setting the OP_PY_CACHE_TTL
+        environment variable additionally enables a process-wide TTL cache
+        shared across instances. Use `invalidate` to drop stale entries.
+
         Args:
             item (str): Can be either the name of the resource or its ID
             fields (list): (optional) This is to narrow down any field values for your return criteria.
@@ -84,31 +274,76 @@ class OnePassword:
             OnePasswordJSONError: if the response cannot be JSON loaded due to a JSONDecodeError exception
         """
 
-        cmd = [
-            "op",
-            "item",
-            "get",
-            item,
-            "--format",
-            "json",
-            "--vault",
-            f"{self.vault}",
-        ]
+        _fields = tuple(fields) if fields else None
+        ttl = opcache.cache_ttl()
+        if ttl is not None:
+            # Bypass the unbounded instance LRU here: if it served as the
+            # fetcher, an expired TTL entry would be refreshed from the stale
+            # LRU value and never actually hit `op` again. The key carries the
+            # concrete class and the Connect host (when present) so backends
+            # with different payload schemas never serve each other's entries
+            key = (type(self), getattr(self, "host", None), self.vault, item, _fields)
+            return opcache.item_cache.get_or_fetch(
+                key,
+                lambda: self._get_item(item, _fields),
+                ttl,
+            )
+        return self._get_item_cached(item, _fields)
+
+    def _get_item(self, item: str, fields: tuple = None) -> Dict | List[Dict]:
+        cmd = [*self._ITEM_GET, item, *self._FMT_JSON, *self._vault_args()]
 
         if fields:
-            _fields = []
-            for field in fields:
-                _fields.append(f"label={field}")
-            cmd += ["--fields", ",".join(_fields)]
+            cmd.extend(("--fields", ",".join("label=" + field for field in fields)))
 
-        r = _run_cmd(cmd)
+        r = self._session.run(cmd)
         try:
-            return json.loads(r.stdout)
-        except json.JSONDecodeError as e:
+            return _loads(r.stdout)
+        except _JSON_ERRORS as e:
             raise opex.OnePasswordJSONError(
                 f"Cannot JSON load response from 1Password. Got {e}"
             )
 
+    def get_items(
+        self, items: List[str], fields: List = None, max_workers: int = 8
+    ) -> List[Dict | List[Dict]]:
+        """
+        Fetch several items in one call. `op` offers no batch or script mode,
+        so the per-item commands are overlapped on a thread pool instead -
+        subprocess startup is I/O-bound and releases the GIL - amortising the
+        CLI's startup latency across the batch. A single requested item takes
+        the plain `get_item` path with no pool, and every result flows through
+        the same per-instance cache as `get_item`.
+
+        Args:
+            items (list): names or UUIDs of items in Vault
+            fields (list): (optional) field labels to narrow each response down to
+            max_workers (int): maximum number of concurrent `op` subprocesses.
+                               Default is 8
+        Returns:
+            List: the `get_item` response for each requested item, in order
+        """
+        if not items:
+            return []
+        if len(items) == 1:
+            return [self.get_item(items[0], fields=fields)]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(items))
+        ) as pool:
+            return list(
+                pool.map(lambda item: self.get_item(item, fields=fields), items)
+            )
+
+    def invalidate(self) -> None:
+        """
+        Drops all cached `get_item` results - both this instance's cache and
+        the shared TTL cache - so the next lookups hit `op` again. Call this
+        after items are known to have changed in the vault.
+        """
+        self._get_item_cached.cache_clear()
+        opcache.item_cache.clear()
+
     def get_value(self, item: str, field: str) -> str:
         """
         Retrieve an artefact from 1password and attempt to parse the field's value from it
@@ -127,6 +362,48 @@ class OnePassword:
         except KeyError as e:
             raise opex.OnePasswordValueNotFound(f"Value not found. Got error: {e}")
 
+    def get_values(self, item: str, fields: List) -> Dict:
+        """
+        Retrieve several field values from an item with a single `op` call,
+        rather than one call per field.
+
+        Args:
+            item (str): name or UUID of item in Vault
+            fields (list): field labels to look up, e.g. ['username', 'password']
+        Returns:
+            Dict: a mapping of field label to value for the requested fields
+
+        Raises:
+            OnePasswordValueNotFound: if a returned field is missing its label or value
+        """
+        r = self.get_item(item, fields=fields)
+        if isinstance(r, dict):
+            r = [r]
+        wanted = set(fields)
+        try:
+            return {f["label"]: f["value"] for f in r if f["label"] in wanted}
+        except KeyError as e:
+            raise opex.OnePasswordValueNotFound(f"Value not found. Got error: {e}")
+
+    def get_credentials(self, item: str) -> Tuple[str, str]:
+        """
+        Wrapper around `get_values` to get an item's username and password
+        together, spawning `op` once instead of twice.
+
+        Args:
+            item (str): name or UUID of item in Vault
+        Returns:
+            Tuple[str, str]: the item's username and password
+
+        Raises:
+            OnePasswordValueNotFound: if the item has no username or password field
+        """
+        values = self.get_values(item, ["username", "password"])
+        try:
+            return values["username"], values["password"]
+        except KeyError as e:
+            raise opex.OnePasswordValueNotFound(f"Value not found. Got error: {e}")
+
     def get_username(self, item: str) -> str:
         """
         Wrapper around `get_value` to get a username value from an item
@@ -177,25 +454,71 @@ class OnePassword:
         Returns:
              bytes: a document in bytes format
         """
-        cmd = ["op", "document", "get", item, "--vault", self.vault]
+        cmd = [*self._DOC_GET, item, *self._vault_args()]
 
-        return _run_cmd(cmd).stdout
+        return self._session.run(cmd).stdout
 
-    def list_items(
-        self, categories: List = None, tags: List = None
-    ) -> Dict | List[Dict]:
+    def get_document_to(self, item: str, dest: BinaryIO | str) -> int:
         """
-        List all available items within the instantiated vault.
+        Stream a document from 1Password into `dest` in 1MiB chunks instead of
+        buffering the whole payload in memory, so peak usage stays at one
+        chunk regardless of document size.
+
+        Args:
+            item (str): name or UUID of item in Vault
+            dest: a writable binary file object, or a path to write the document to
+        Returns:
+             int: the number of bytes written to `dest`
+
+        Raises:
+            OnePasswordCLINotFound: If the 1password-CLI is not found due to a FileNotFoundError exception
+            OnePasswordRuntimeError: if the subprocess exits with a non-zero code
+        """
+        if isinstance(dest, (str, os.PathLike)):
+            with open(dest, "wb") as f:
+                return self.get_document_to(item, f)
+
+        cmd = [*self._DOC_GET, item, *self._vault_args()]
+
+        try:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except FileNotFoundError:
+            raise opex.OnePasswordCLINotFound(
+                msg="Cannot find `op`, do you have 1password-cli installed?"
+            )
+        # The context manager closes both pipes and reaps the child even when
+        # dest.write raises mid-stream
+        with proc:
+            written = 0
+            while chunk := proc.stdout.read(1 << 20):
+                dest.write(chunk)
+                written += len(chunk)
+            if proc.wait() != 0:
+                stderr = proc.stderr.read().decode(errors="replace")
+                raise opex.OnePasswordRuntimeError(
+                    f"Encountered an error when calling subprocess, got: {stderr}"
+                )
+        return written
+
+    def iter_items(self, categories: List = None, tags: List = None) -> Iterator[Dict]:
+        """
+        Lazily iterate over the items within the instantiated vault, decoding
+        one entry at a time rather than materialising the whole list. Callers
+        that filter and discard most entries never allocate them.
         Entries can be filtered with `categories` and `tags`. By default, these are None.
 
         Args:
             categories (list): (optional) A list of categories to filter the list with
             tags (list): (optional) A list of tags to filter the list with
-        Returns:
-            Dict | List[Dict]: either a single item as a dictionary or multiple items as a list of dictionaries
+        Yields:
+            Dict: one item at a time
         """
 
-        cmd = ["op", "items", "list", "--vault", self.vault, "--format", "json"]
+        cmd = self._items_cmd(categories, tags)
+        yield from _iter_json_array(self._session.run(cmd).stdout)
+
+    def _items_cmd(self, categories: List = None, tags: List = None) -> List:
+        cmd = [*self._ITEMS_LIST, *self._vault_args(), *self._FMT_JSON]
 
         if categories:
             cmd += ["--categories", ",".join(categories)]
@@ -203,4 +526,22 @@ class OnePassword:
         if tags:
             cmd += ["--tags", ",".join(tags)]
 
-        return json.loads(_run_cmd(cmd).stdout)
+        return cmd
+
+    def list_items(
+        self, categories: List = None, tags: List = None
+    ) -> Dict | List[Dict]:
+        """
+        List all available items within the instantiated vault.
+        Entries can be filtered with `categories` and `tags`. By default, these are None.
+
+        Args:
+            categories (list): (optional) A list of categories to filter the list with
+            tags (list): (optional) A list of tags to filter the list with
+        Returns:
+            Dict | List[Dict]: either a single item as a dictionary or multiple items as a list of dictionaries
+        """
+
+        # Decoded whole rather than via iter_items so a non-array payload
+        # keeps its original shape instead of being wrapped in a list
+        return _loads(self._session.run(self._items_cmd(categories, tags)).stdout)
@@ -0,0 +1,134 @@
+import unittest
+import json
+
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from onepassword import aio
+
+
+class TestAsyncRunCmd(unittest.IsolatedAsyncioTestCase):
+    @patch("asyncio.create_subprocess_exec")
+    async def test_run_cmd_success(self, mock_create_subprocess_exec):
+        mock_proc = MagicMock()
+        mock_proc.communicate = AsyncMock(return_value=(b"2.23.0\n", b""))
+        mock_proc.returncode = 0
+        mock_create_subprocess_exec.return_value = mock_proc
+
+        result = await aio._run_cmd(["op", "--version"])
+
+        mock_create_subprocess_exec.assert_called_once()
+        self.assertEqual(result, b"2.23.0\n")
+
+    @patch("asyncio.create_subprocess_exec")
+    async def test_run_cmd_error(self, mock_create_subprocess_exec):
+        mock_proc = MagicMock()
+        mock_proc.communicate = AsyncMock(return_value=(b"", b"I have failed"))
+        mock_proc.returncode = 1
+        mock_create_subprocess_exec.return_value = mock_proc
+
+        with self.assertRaises(aio.opex.OnePasswordRuntimeError):
+            await aio._run_cmd(["op", "item", "get", "Foo"])
+
+    @patch("asyncio.create_subprocess_exec")
+    async def test_run_cmd_cli_not_found(self, mock_create_subprocess_exec):
+        mock_create_subprocess_exec.side_effect = FileNotFoundError(
+            "No such file or directory: 'op'"
+        )
+
+        with self.assertRaises(aio.opex.OnePasswordCLINotFound):
+            await aio._run_cmd(["op", "--version"])
+
+
+class TestAsyncGetItem(unittest.IsolatedAsyncioTestCase):
+    @patch("onepassword.aio._run_cmd")
+    async def test_get_item_success(self, mock_run_cmd):
+        expected_response = {"category": "LOGIN", "id": "id123456789"}
+        mock_run_cmd.return_value = json.dumps(expected_response).encode()
+
+        op = aio.AsyncOnePassword("Private")
+
+        result = await op.get_item("Foo")
+
+        mock_run_cmd.assert_called_once_with(
+            ["op", "item", "get", "Foo", "--format", "json", "--vault", "Private"]
+        )
+
+        self.assertEqual(result, expected_response)
+
+    @patch("onepassword.aio._run_cmd")
+    async def test_get_item_with_fields(self, mock_run_cmd):
+        expected_response = {"label": "username", "value": "bar@example.com"}
+        mock_run_cmd.return_value = json.dumps(expected_response).encode()
+
+        op = aio.AsyncOnePassword("Private")
+
+        result = await op.get_item("Foo", fields=["username"])
+
+        mock_run_cmd.assert_called_once_with(
+            [
+                "op",
+                "item",
+                "get",
+                "Foo",
+                "--format",
+                "json",
+                "--vault",
+                "Private",
+                "--fields",
+                "label=username",
+            ]
+        )
+
+        self.assertEqual(result, expected_response)
+
+    @patch("onepassword.aio._run_cmd")
+    async def test_get_item_json_error(self, mock_run_cmd):
+        mock_run_cmd.return_value = b"Invalid JSON"
+
+        op = aio.AsyncOnePassword("Private")
+
+        with self.assertRaises(aio.opex.OnePasswordJSONError):
+            await op.get_item("Foo")
+
+        mock_run_cmd.assert_called_once()
+
+
+class TestAsyncGetItems(unittest.IsolatedAsyncioTestCase):
+    @patch("onepassword.aio._run_cmd")
+    async def test_get_items_gathers_in_order(self, mock_run_cmd):
+        responses = {
+            "Foo": {"id": "uuid_foo"},
+            "Bar": {"id": "uuid_bar"},
+        }
+
+        async def fake_run_cmd(cmd):
+            return json.dumps(responses[cmd[3]]).encode()
+
+        mock_run_cmd.side_effect = fake_run_cmd
+
+        op = aio.AsyncOnePassword("Private")
+
+        result = await op.get_items(["Foo", "Bar"])
+
+        self.assertEqual(result, [{"id": "uuid_foo"}, {"id": "uuid_bar"}])
+        self.assertEqual(mock_run_cmd.call_count, 2)
+
+
+class TestAsyncGetValues(unittest.IsolatedAsyncioTestCase):
+    @patch("onepassword.aio.AsyncOnePassword.get_item")
+    async def test_get_values_success(self, mock_get_item):
+        mock_get_item.return_value = [
+            {"label": "username", "value": "bar@example.com"},
+            {"label": "password", "value": "some_secret_password"},
+        ]
+
+        op = aio.AsyncOnePassword("Private")
+
+        result = await op.get_values("foo", ["username", "password"])
+
+        mock_get_item.assert_called_once_with("foo", fields=["username", "password"])
+
+        self.assertEqual(
+            result,
+            {"username": "bar@example.com", "password": "some_secret_password"},
+        )
@@ -0,0 +1,153 @@
+import unittest
+import json
+import urllib.parse
+
+from unittest.mock import patch, MagicMock
+
+from onepassword import cache, connect, onepassword
+
+
+class TestCacheTTL(unittest.TestCase):
+    def test_cache_ttl_disabled_by_default(self):
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertIsNone(cache.cache_ttl())
+
+    def test_cache_ttl_from_environment(self):
+        with patch.dict("os.environ", {"OP_PY_CACHE_TTL": "30"}, clear=True):
+            self.assertEqual(cache.cache_ttl(), 30.0)
+
+    def test_cache_ttl_invalid_values_disable_caching(self):
+        for raw in ("not_a_number", "0", "-5"):
+            with patch.dict("os.environ", {"OP_PY_CACHE_TTL": raw}, clear=True):
+                self.assertIsNone(cache.cache_ttl())
+
+
+class TestItemCache(unittest.TestCase):
+    def test_get_or_fetch_caches_value(self):
+        item_cache = cache.ItemCache()
+        fetcher = MagicMock(return_value={"id": "uuid_foo"})
+
+        first = item_cache.get_or_fetch(("Private", "Foo", None), fetcher, ttl=60)
+        second = item_cache.get_or_fetch(("Private", "Foo", None), fetcher, ttl=60)
+
+        fetcher.assert_called_once()
+        self.assertEqual(first, second)
+
+    def test_get_or_fetch_expires(self):
+        item_cache = cache.ItemCache()
+        fetcher = MagicMock(return_value={"id": "uuid_foo"})
+
+        with patch("onepassword.cache.time.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 0.0
+            item_cache.get_or_fetch(("Private", "Foo", None), fetcher, ttl=60)
+
+            # Within the TTL the entry is served from the cache
+            mock_monotonic.return_value = 59.0
+            item_cache.get_or_fetch(("Private", "Foo", None), fetcher, ttl=60)
+            fetcher.assert_called_once()
+
+            # Beyond the TTL the entry is refetched
+            mock_monotonic.return_value = 61.0
+            item_cache.get_or_fetch(("Private", "Foo", None), fetcher, ttl=60)
+            self.assertEqual(fetcher.call_count, 2)
+
+    def test_clear(self):
+        item_cache = cache.ItemCache()
+        fetcher = MagicMock(return_value={"id": "uuid_foo"})
+
+        item_cache.get_or_fetch(("Private", "Foo", None), fetcher, ttl=60)
+        item_cache.clear()
+        item_cache.get_or_fetch(("Private", "Foo", None), fetcher, ttl=60)
+
+        self.assertEqual(fetcher.call_count, 2)
+
+
+class TestGetItemSharedCache(unittest.TestCase):
+    def setUp(self):
+        cache.item_cache.clear()
+
+    def tearDown(self):
+        cache.item_cache.clear()
+
+    @patch("onepassword.onepassword._run_cmd")
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_get_item_shared_across_instances(self, mock_list_vaults, mock_run_cmd):
+        mock_run_cmd.return_value = MagicMock(
+            stdout=json.dumps({"id": "id123456789"}), stderr=b"", returncode=0
+        )
+
+        with patch.dict("os.environ", {"OP_PY_CACHE_TTL": "60"}, clear=True):
+            first = onepassword.OnePassword("Private")
+            second = onepassword.OnePassword("Private")
+
+            first.get_item("Foo")
+            result = second.get_item("Foo")
+
+        # The second instance is served from the shared cache without a spawn
+        mock_run_cmd.assert_called_once()
+        self.assertEqual(result, {"id": "id123456789"})
+
+    @patch("onepassword.onepassword._run_cmd")
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_get_item_refetches_after_expiry(self, mock_list_vaults, mock_run_cmd):
+        mock_run_cmd.return_value = MagicMock(
+            stdout=json.dumps({"id": "id123456789"}), stderr=b"", returncode=0
+        )
+
+        with patch.dict("os.environ", {"OP_PY_CACHE_TTL": "60"}, clear=True):
+            with patch("onepassword.cache.time.monotonic") as mock_monotonic:
+                mock_monotonic.return_value = 0.0
+
+                op = onepassword.OnePassword("Private")
+                op.get_item("Foo")
+                op.get_item("Foo")
+
+                # Within the TTL only one spawn happens
+                mock_run_cmd.assert_called_once()
+
+                # Beyond the TTL the lookup must go back to `op`
+                mock_monotonic.return_value = 61.0
+                op.get_item("Foo")
+
+        self.assertEqual(mock_run_cmd.call_count, 2)
+
+    @patch("onepassword.connect.ConnectClient._get")
+    @patch("onepassword.onepassword._run_cmd")
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_backends_do_not_share_entries(
+        self, mock_list_vaults, mock_run_cmd, mock_get
+    ):
+        cli_payload = {"id": "id123456789"}
+        mock_run_cmd.return_value = MagicMock(
+            stdout=json.dumps(cli_payload), stderr=b"", returncode=0
+        )
+
+        connect_payload = {"id": "item_uuid", "category": "LOGIN"}
+        responses = {
+            "/vaults?filter="
+            + urllib.parse.quote('name eq "Private"'): [
+                {"id": "vault_uuid", "name": "Private"}
+            ],
+            "/vaults/vault_uuid/items?filter="
+            + urllib.parse.quote('title eq "Foo"'): [
+                {"id": "item_uuid", "title": "Foo"}
+            ],
+            "/vaults/vault_uuid/items/item_uuid": connect_payload,
+        }
+        mock_get.side_effect = lambda path: json.dumps(responses[path]).encode()
+
+        env = {
+            "OP_PY_CACHE_TTL": "60",
+            "OP_CONNECT_HOST": "https://connect.example.com",
+            "OP_CONNECT_TOKEN": "some_token",
+        }
+        with patch.dict("os.environ", env, clear=True):
+            cli = onepassword.OnePassword("Private")
+            conn = connect.ConnectClient("Private")
+
+            # Each backend must fetch its own payload, not the other's entry
+            self.assertEqual(cli.get_item("Foo"), cli_payload)
+            self.assertEqual(conn.get_item("Foo"), connect_payload)
+
+        mock_run_cmd.assert_called_once()
+        self.assertTrue(mock_get.called)
@@ -0,0 +1,214 @@
+import unittest
+import io
+import json
+import urllib.parse
+
+from unittest.mock import patch, MagicMock
+
+from onepassword import connect
+
+VAULTS_PATH = "/vaults?filter=" + urllib.parse.quote('name eq "Private"')
+ITEMS_FILTER_PATH = "/vaults/vault_uuid/items?filter=" + urllib.parse.quote(
+    'title eq "Foo"'
+)
+
+
+def _connect_client():
+    return connect.ConnectClient(
+        "Private", host="https://connect.example.com", token="some_token"
+    )
+
+
+class TestConnectClientInit(unittest.TestCase):
+    def test_init_without_config_raises(self):
+        with patch.dict("os.environ", {}, clear=True):
+            with self.assertRaises(connect.opex.OnePasswordConnectError):
+                connect.ConnectClient("Private")
+
+    def test_init_from_environment(self):
+        env = {
+            "OP_CONNECT_HOST": "https://connect.example.com/",
+            "OP_CONNECT_TOKEN": "some_token",
+        }
+        with patch.dict("os.environ", env, clear=True):
+            client = connect.ConnectClient("Private")
+
+        self.assertEqual(client.host, "https://connect.example.com")
+        self.assertEqual(client.token, "some_token")
+
+
+class TestConnectGetItem(unittest.TestCase):
+    @patch("onepassword.connect.ConnectClient._get")
+    def test_get_item_success(self, mock_get):
+        expected_item = {
+            "id": "item_uuid",
+            "category": "LOGIN",
+            "fields": [
+                {"label": "username", "value": "bar@example.com"},
+                {"label": "password", "value": "some_secret_password"},
+            ],
+        }
+        responses = {
+            VAULTS_PATH: [{"id": "vault_uuid", "name": "Private"}],
+            ITEMS_FILTER_PATH: [{"id": "item_uuid", "title": "Foo"}],
+            "/vaults/vault_uuid/items/item_uuid": expected_item,
+        }
+        mock_get.side_effect = lambda path: json.dumps(responses[path]).encode()
+
+        client = _connect_client()
+
+        result = client.get_item("Foo")
+
+        self.assertEqual(result, expected_item)
+
+    @patch("onepassword.connect.ConnectClient._get")
+    def test_get_item_with_fields(self, mock_get):
+        item = {
+            "id": "item_uuid",
+            "fields": [
+                {"label": "username", "value": "bar@example.com"},
+                {"label": "password", "value": "some_secret_password"},
+            ],
+        }
+        responses = {
+            VAULTS_PATH: [{"id": "vault_uuid", "name": "Private"}],
+            ITEMS_FILTER_PATH: [{"id": "item_uuid", "title": "Foo"}],
+            "/vaults/vault_uuid/items/item_uuid": item,
+        }
+        mock_get.side_effect = lambda path: json.dumps(responses[path]).encode()
+
+        client = _connect_client()
+
+        # A single requested field mirrors the CLI and returns one object
+        result = client.get_item("Foo", fields=["username"])
+
+        self.assertEqual(result, {"label": "username", "value": "bar@example.com"})
+
+    @patch("onepassword.connect.ConnectClient._get")
+    def test_get_item_no_matching_field(self, mock_get):
+        item = {
+            "id": "item_uuid",
+            "fields": [{"label": "username", "value": "bar@example.com"}],
+        }
+        responses = {
+            VAULTS_PATH: [{"id": "vault_uuid", "name": "Private"}],
+            ITEMS_FILTER_PATH: [{"id": "item_uuid", "title": "Foo"}],
+            "/vaults/vault_uuid/items/item_uuid": item,
+        }
+        mock_get.side_effect = lambda path: json.dumps(responses[path]).encode()
+
+        client = _connect_client()
+
+        with self.assertRaises(connect.opex.OnePasswordValueNotFound):
+            client.get_value("Foo", "nonexistent")
+
+    @patch("onepassword.connect.ConnectClient._get")
+    def test_get_value_success(self, mock_get):
+        item = {
+            "id": "item_uuid",
+            "fields": [{"label": "password", "value": "some_secret_password"}],
+        }
+        responses = {
+            VAULTS_PATH: [{"id": "vault_uuid", "name": "Private"}],
+            ITEMS_FILTER_PATH: [{"id": "item_uuid", "title": "Foo"}],
+            "/vaults/vault_uuid/items/item_uuid": item,
+        }
+        mock_get.side_effect = lambda path: json.dumps(responses[path]).encode()
+
+        client = _connect_client()
+
+        self.assertEqual(client.get_value("Foo", "password"), "some_secret_password")
+
+
+class TestConnectGetDocumentTo(unittest.TestCase):
+    @patch("urllib.request.urlopen")
+    @patch("onepassword.connect.ConnectClient._get")
+    def test_get_document_to_streams_chunks(self, mock_get, mock_urlopen):
+        item = {
+            "id": "item_uuid",
+            "files": [{"id": "file_uuid", "name": "document.txt"}],
+        }
+        responses = {
+            VAULTS_PATH: [{"id": "vault_uuid", "name": "Private"}],
+            ITEMS_FILTER_PATH: [{"id": "item_uuid", "title": "Foo"}],
+            "/vaults/vault_uuid/items/item_uuid": item,
+        }
+        mock_get.side_effect = lambda path: json.dumps(responses[path]).encode()
+
+        mock_resp = MagicMock()
+        mock_resp.read.side_effect = [b"Test ", b"document", b""]
+        mock_urlopen.return_value.__enter__.return_value = mock_resp
+
+        client = _connect_client()
+
+        dest = io.BytesIO()
+        written = client.get_document_to("Foo", dest)
+
+        request = mock_urlopen.call_args.args[0]
+        self.assertEqual(
+            request.full_url,
+            "https://connect.example.com/v1/vaults/vault_uuid/items/item_uuid"
+            "/files/file_uuid/content",
+        )
+
+        self.assertEqual(dest.getvalue(), b"Test document")
+        self.assertEqual(written, len(b"Test document"))
+
+    @patch("onepassword.connect.ConnectClient._get")
+    def test_get_document_to_no_file(self, mock_get):
+        responses = {
+            VAULTS_PATH: [{"id": "vault_uuid", "name": "Private"}],
+            ITEMS_FILTER_PATH: [{"id": "item_uuid", "title": "Foo"}],
+            "/vaults/vault_uuid/items/item_uuid": {"id": "item_uuid", "files": []},
+        }
+        mock_get.side_effect = lambda path: json.dumps(responses[path]).encode()
+
+        client = _connect_client()
+
+        with self.assertRaises(connect.opex.OnePasswordValueNotFound):
+            client.get_document_to("Foo", io.BytesIO())
+
+
+class TestConnectListItems(unittest.TestCase):
+    @patch("onepassword.connect.ConnectClient._get")
+    def test_list_items_with_filters(self, mock_get):
+        items = [
+            {"id": "item1", "category": "LOGIN", "tags": ["some_tag"]},
+            {"id": "item2", "category": "PASSWORD", "tags": ["some_tag"]},
+            {"id": "item3", "category": "LOGIN", "tags": []},
+        ]
+        responses = {
+            VAULTS_PATH: [{"id": "vault_uuid", "name": "Private"}],
+            "/vaults/vault_uuid/items": items,
+        }
+        mock_get.side_effect = lambda path: json.dumps(responses[path]).encode()
+
+        client = _connect_client()
+
+        result = client.list_items(categories=["Login"], tags=["some_tag"])
+
+        self.assertEqual(result, [items[0]])
+
+
+class TestConnectVaultResolution(unittest.TestCase):
+    @patch("onepassword.connect.ConnectClient._get")
+    def test_vault_uuid_resolved_once(self, mock_get):
+        mock_get.return_value = json.dumps(
+            [{"id": "vault_uuid", "name": "Private"}]
+        ).encode()
+
+        client = _connect_client()
+
+        self.assertEqual(client._vault_id(), "vault_uuid")
+        self.assertEqual(client._vault_id(), "vault_uuid")
+
+        mock_get.assert_called_once_with(VAULTS_PATH)
+
+    @patch("onepassword.connect.ConnectClient._get")
+    def test_vault_not_found(self, mock_get):
+        mock_get.return_value = b"[]"
+
+        client = _connect_client()
+
+        with self.assertRaises(connect.opex.OnePasswordValueNotFound):
+            client._vault_id()
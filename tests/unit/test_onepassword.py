@@ -1,5 +1,8 @@
 import unittest
+import io
 import json
+import pickle
+import subprocess
 
 from unittest.mock import patch, MagicMock
 from packaging.version import Version
@@ -8,6 +11,10 @@ from onepassword import onepassword
 
 
 class TestGetOpCliVersion(unittest.TestCase):
+    def setUp(self):
+        # get_op_cli_version is memoised process-wide; start each test clean
+        onepassword.get_op_cli_version.cache_clear()
+
     @patch("subprocess.run")
     def test_get_op_cli_version_success(self, mock_subprocess_run):
         mock_subprocess_run.return_value = MagicMock(
@@ -38,44 +45,81 @@ class TestGetOpCliVersion(unittest.TestCase):
             ["op", "--version"], capture_output=True, text=True
         )
 
-
-class TestRunCmd(unittest.TestCase):
     @patch("subprocess.run")
-    def test_run_cmd(self, mock_subprocess_run):
-        # Mock subprocess.run to return a known CompletedProcess object
+    def test_get_op_cli_version_memoised(self, mock_subprocess_run):
         mock_subprocess_run.return_value = MagicMock(
             stdout="2.23.0\n", stderr="", returncode=0
         )
 
+        first = onepassword.get_op_cli_version()
+        second = onepassword.get_op_cli_version()
+
+        # The second call must be served from the cache without a new spawn
+        mock_subprocess_run.assert_called_once_with(
+            ["op", "--version"], capture_output=True, text=True
+        )
+        self.assertEqual(first, second)
+
+
+class TestRunCmd(unittest.TestCase):
+    @patch("subprocess.Popen")
+    def test_run_cmd(self, mock_popen):
+        # Mock Popen to return a process with known pipe contents
+        mock_proc = MagicMock()
+        mock_proc.stdout.read.return_value = b"2.23.0\n"
+        mock_proc.stderr.read.return_value = b""
+        mock_proc.wait.return_value = 0
+        mock_popen.return_value = mock_proc
+
         # Call the function to test
         cmd = ["op", "--version"]
         result = onepassword._run_cmd(cmd)
 
-        # Assert that the subprocess.run was called with the correct arguments
-        mock_subprocess_run.assert_called_once_with(cmd, capture_output=True)
+        # Assert that Popen was called with the correct arguments
+        mock_popen.assert_called_once_with(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False
+        )
 
         # Assert that the returned value is the expected CompletedProcess object
-        self.assertEqual(result.stdout, "2.23.0\n")
-        self.assertEqual(result.stderr, "")
+        self.assertEqual(result.stdout, b"2.23.0\n")
+        self.assertEqual(result.stderr, b"")
         self.assertEqual(result.returncode, 0)
 
-    @patch("subprocess.run")
-    def test_run_cmd_error(self, mock_subprocess_run):
-        mock_subprocess_run.return_value = MagicMock(
-            stdout=b"", stderr=b"I have failed", returncode=1
-        )
+        # stderr must not be read on the happy path, and the process context
+        # manager must clean up the pipes
+        mock_proc.stderr.read.assert_not_called()
+        mock_proc.__exit__.assert_called_once()
+
+    @patch("subprocess.Popen")
+    def test_run_cmd_error(self, mock_popen):
+        mock_proc = MagicMock()
+        mock_proc.stdout.read.return_value = b""
+        mock_proc.stderr.read.return_value = b"I have failed"
+        mock_proc.wait.return_value = 1
+        mock_popen.return_value = mock_proc
 
         with self.assertRaises(onepassword.opex.OnePasswordRuntimeError):
             onepassword._run_cmd(["nonexistent", "please", "fail"])
 
-        mock_subprocess_run.assert_called_once_with(
-            ["nonexistent", "please", "fail"], capture_output=True
+        mock_popen.assert_called_once_with(
+            ["nonexistent", "please", "fail"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=False,
         )
 
+    @patch("subprocess.Popen")
+    def test_run_cmd_cli_not_found(self, mock_popen):
+        mock_popen.side_effect = FileNotFoundError("No such file or directory: 'op'")
+
+        with self.assertRaises(onepassword.opex.OnePasswordCLINotFound):
+            onepassword._run_cmd(["op", "--version"])
+
 
 class TestGetItem(unittest.TestCase):
     @patch("onepassword.onepassword._run_cmd")
-    def test_get_item_success_without_fields(self, mock_run_cmd):
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_get_item_success_without_fields(self, mock_list_vaults, mock_run_cmd):
         expected_response = {
             "category": "LOGIN",
             "id": "id123456789",
@@ -114,7 +158,8 @@ class TestGetItem(unittest.TestCase):
         self.assertEqual(result, expected_response)
 
     @patch("onepassword.onepassword._run_cmd")
-    def test_get_item_success_with_fields(self, mock_run_cmd):
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_get_item_success_with_fields(self, mock_list_vaults, mock_run_cmd):
         expected_response = {
             "category": "LOGIN",
             "id": "id123456789",
@@ -157,7 +202,8 @@ class TestGetItem(unittest.TestCase):
         self.assertEqual(result, expected_response)
 
     @patch("onepassword.onepassword._run_cmd")
-    def test_get_item_json_error(self, mock_run_cmd):
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_get_item_json_error(self, mock_list_vaults, mock_run_cmd):
         invalid_json_response = "Invalid JSON"
         mock_run_cmd.return_value = MagicMock(
             stdout=invalid_json_response, stderr="", returncode=0
@@ -170,6 +216,117 @@ class TestGetItem(unittest.TestCase):
 
         mock_run_cmd.assert_called_once()
 
+    @patch("onepassword.onepassword._run_cmd")
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_get_item_cached(self, mock_list_vaults, mock_run_cmd):
+        expected_response = {"id": "id123456789"}
+        mock_run_cmd.return_value = MagicMock(
+            stdout=json.dumps(expected_response), stderr="", returncode=0
+        )
+
+        op = onepassword.OnePassword("Private")
+
+        op.get_item("Foo")
+        result = op.get_item("Foo")
+
+        mock_run_cmd.assert_called_once()
+        self.assertEqual(result, expected_response)
+
+        op.invalidate()
+        op.get_item("Foo")
+
+        self.assertEqual(mock_run_cmd.call_count, 2)
+
+
+class TestPickling(unittest.TestCase):
+    def test_pickle_round_trip(self):
+        op = onepassword.OnePassword("Work")
+
+        restored = pickle.loads(pickle.dumps(op))
+
+        self.assertEqual(restored.vault, "Work")
+
+    @patch("onepassword.onepassword._run_cmd")
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_unpickled_instance_is_usable(self, mock_list_vaults, mock_run_cmd):
+        expected_response = {"id": "id123456789"}
+        mock_run_cmd.return_value = MagicMock(
+            stdout=json.dumps(expected_response), stderr=b"", returncode=0
+        )
+
+        op = onepassword.OnePassword("Private")
+        # Warm the cache so the pickled instance has used its session
+        op.get_item("Foo")
+
+        restored = pickle.loads(pickle.dumps(op))
+
+        result = restored.get_item("Foo")
+
+        self.assertEqual(result, expected_response)
+
+
+class TestGetItems(unittest.TestCase):
+    @patch("onepassword.OnePassword.get_item")
+    def test_get_items_batch(self, mock_get_item):
+        responses = {"Foo": {"id": "uuid_foo"}, "Bar": {"id": "uuid_bar"}}
+        mock_get_item.side_effect = lambda item, fields=None: responses[item]
+
+        op = onepassword.OnePassword("Private")
+
+        result = op.get_items(["Foo", "Bar"])
+
+        self.assertEqual(result, [{"id": "uuid_foo"}, {"id": "uuid_bar"}])
+        self.assertEqual(mock_get_item.call_count, 2)
+
+    @patch("onepassword.OnePassword.get_item")
+    def test_get_items_single_item_skips_pool(self, mock_get_item):
+        mock_get_item.return_value = {"id": "uuid_foo"}
+
+        op = onepassword.OnePassword("Private")
+
+        result = op.get_items(["Foo"], fields=["username"])
+
+        mock_get_item.assert_called_once_with("Foo", fields=["username"])
+        self.assertEqual(result, [{"id": "uuid_foo"}])
+
+    def test_get_items_empty(self):
+        op = onepassword.OnePassword("Private")
+
+        self.assertEqual(op.get_items([]), [])
+
+
+class TestVaultResolution(unittest.TestCase):
+    @patch("onepassword.onepassword._run_cmd")
+    @patch("onepassword.onepassword.list_vaults")
+    def test_vault_name_resolved_to_uuid_once(self, mock_list_vaults, mock_run_cmd):
+        mock_list_vaults.return_value = [
+            {"id": "vault_uuid", "name": "Private"},
+            {"id": "other_uuid", "name": "Work"},
+        ]
+        mock_run_cmd.return_value = MagicMock(
+            stdout=json.dumps({"id": "id123456789"}), stderr="", returncode=0
+        )
+
+        op = onepassword.OnePassword("Private")
+
+        op.get_item("Foo")
+        op.get_item("Bar")
+
+        mock_run_cmd.assert_any_call(
+            ["op", "item", "get", "Foo", "--format", "json", "--vault", "vault_uuid"]
+        )
+        mock_list_vaults.assert_called_once()
+
+    @patch("onepassword.onepassword.list_vaults")
+    def test_vault_resolution_falls_back_to_raw_string(self, mock_list_vaults):
+        mock_list_vaults.side_effect = onepassword.opex.OnePasswordRuntimeError(
+            "I have failed"
+        )
+
+        op = onepassword.OnePassword("some_vault_uuid")
+
+        self.assertEqual(op._vault_id(), "some_vault_uuid")
+
 
 class TestGetUUID(unittest.TestCase):
     @patch("onepassword.OnePassword.get_item")
@@ -226,6 +383,78 @@ class TestGetValue(unittest.TestCase):
         mock_get_item.assert_called_once_with("foo", fields=["bar"])
 
 
+class TestGetValues(unittest.TestCase):
+    @patch("onepassword.OnePassword.get_item")
+    def test_get_values_success(self, mock_get_item):
+        expected_fields = [
+            {"label": "username", "value": "bar@example.com"},
+            {"label": "password", "value": "some_secret_password"},
+        ]
+        mock_get_item.return_value = expected_fields
+
+        op = onepassword.OnePassword("Private")
+
+        result = op.get_values("foo", ["username", "password"])
+
+        mock_get_item.assert_called_once_with("foo", fields=["username", "password"])
+
+        self.assertEqual(
+            result,
+            {"username": "bar@example.com", "password": "some_secret_password"},
+        )
+
+    @patch("onepassword.OnePassword.get_item")
+    def test_get_values_single_field(self, mock_get_item):
+        mock_get_item.return_value = {"label": "username", "value": "bar@example.com"}
+
+        op = onepassword.OnePassword("Private")
+
+        result = op.get_values("foo", ["username"])
+
+        mock_get_item.assert_called_once_with("foo", fields=["username"])
+
+        self.assertEqual(result, {"username": "bar@example.com"})
+
+    @patch("onepassword.OnePassword.get_item")
+    def test_get_values_key_error(self, mock_get_item):
+        mock_get_item.return_value = [{"label": "username"}]
+
+        op = onepassword.OnePassword("Private")
+
+        with self.assertRaises(onepassword.opex.OnePasswordValueNotFound):
+            op.get_values("foo", ["username"])
+
+        mock_get_item.assert_called_once_with("foo", fields=["username"])
+
+
+class TestGetCredentials(unittest.TestCase):
+    @patch("onepassword.OnePassword.get_values")
+    def test_get_credentials_success(self, mock_get_values):
+        mock_get_values.return_value = {
+            "username": "bar@example.com",
+            "password": "some_secret_password",
+        }
+
+        op = onepassword.OnePassword("Private")
+
+        result = op.get_credentials("foo")
+
+        mock_get_values.assert_called_once_with("foo", ["username", "password"])
+
+        self.assertEqual(result, ("bar@example.com", "some_secret_password"))
+
+    @patch("onepassword.OnePassword.get_values")
+    def test_get_credentials_missing_field(self, mock_get_values):
+        mock_get_values.return_value = {"username": "bar@example.com"}
+
+        op = onepassword.OnePassword("Private")
+
+        with self.assertRaises(onepassword.opex.OnePasswordValueNotFound):
+            op.get_credentials("foo")
+
+        mock_get_values.assert_called_once_with("foo", ["username", "password"])
+
+
 class TestGetUsername(unittest.TestCase):
     @patch("onepassword.OnePassword.get_value")
     def test_get_username_success(self, mock_get_value):
@@ -258,7 +487,8 @@ class TestGetPassword(unittest.TestCase):
 
 class TestGetDocument(unittest.TestCase):
     @patch("onepassword.onepassword._run_cmd")
-    def test_get_document_success(self, mock_run_cmd):
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_get_document_success(self, mock_list_vaults, mock_run_cmd):
         expected_document_content = b"Test document"
         mock_run_cmd.return_value = MagicMock(
             stdout=expected_document_content, stderr=b"", returncode=0
@@ -275,6 +505,48 @@ class TestGetDocument(unittest.TestCase):
         self.assertEqual(result, expected_document_content)
 
 
+class TestGetDocumentTo(unittest.TestCase):
+    @patch("subprocess.Popen")
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_get_document_to_streams_chunks(self, mock_list_vaults, mock_popen):
+        mock_proc = MagicMock()
+        mock_proc.stdout.read.side_effect = [b"Test ", b"document", b""]
+        mock_proc.stderr.read.return_value = b""
+        mock_proc.wait.return_value = 0
+        mock_popen.return_value = mock_proc
+
+        op = onepassword.OnePassword("Private")
+
+        dest = io.BytesIO()
+        written = op.get_document_to("foo", dest)
+
+        mock_popen.assert_called_once_with(
+            ["op", "document", "get", "foo", "--vault", "Private"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+        self.assertEqual(dest.getvalue(), b"Test document")
+        self.assertEqual(written, len(b"Test document"))
+
+        # The process context manager must clean up the pipes
+        mock_proc.__exit__.assert_called_once()
+
+    @patch("subprocess.Popen")
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_get_document_to_error(self, mock_list_vaults, mock_popen):
+        mock_proc = MagicMock()
+        mock_proc.stdout.read.side_effect = [b""]
+        mock_proc.stderr.read.return_value = b"I have failed"
+        mock_proc.wait.return_value = 1
+        mock_popen.return_value = mock_proc
+
+        op = onepassword.OnePassword("Private")
+
+        with self.assertRaises(onepassword.opex.OnePasswordRuntimeError):
+            op.get_document_to("foo", io.BytesIO())
+
+
 class TestListVaults(unittest.TestCase):
     @patch("onepassword.onepassword._run_cmd")
     def test_list_vaults_success(self, mock_run_cmd):
@@ -297,7 +569,8 @@ class TestListVaults(unittest.TestCase):
 
 class TestListItems(unittest.TestCase):
     @patch("onepassword.onepassword._run_cmd")
-    def test_list_items_no_filters(self, mock_run_cmd):
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_list_items_no_filters(self, mock_list_vaults, mock_run_cmd):
         expected_items = [
             {"id": "item1", "name": "Item 1"},
             {"id": "item2", "name": "Item 2"},
@@ -317,7 +590,30 @@ class TestListItems(unittest.TestCase):
         self.assertEqual(result, expected_items)
 
     @patch("onepassword.onepassword._run_cmd")
-    def test_list_items_with_filters(self, mock_run_cmd):
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_iter_items_is_lazy(self, mock_list_vaults, mock_run_cmd):
+        expected_items = [
+            {"id": "item1", "name": "Item 1"},
+            {"id": "item2", "name": "Item 2"},
+        ]
+        mock_run_cmd.return_value = MagicMock(
+            stdout=json.dumps(expected_items), stderr=b"", returncode=0
+        )
+
+        op = onepassword.OnePassword("Private")
+
+        items = op.iter_items()
+
+        # Nothing runs until the generator is consumed
+        mock_run_cmd.assert_not_called()
+
+        self.assertEqual(next(items), expected_items[0])
+        self.assertEqual(list(items), expected_items[1:])
+        mock_run_cmd.assert_called_once()
+
+    @patch("onepassword.onepassword._run_cmd")
+    @patch("onepassword.onepassword.list_vaults", return_value=[])
+    def test_list_items_with_filters(self, mock_list_vaults, mock_run_cmd):
         expected_items = [{"id": "item1", "name": "Item 1"}]
         mock_run_cmd.return_value = MagicMock(
             stdout=json.dumps(expected_items), stderr=b"", returncode=0